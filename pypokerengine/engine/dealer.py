@@ -1,5 +1,4 @@
-import random
-from collections import OrderedDict
+import os
 
 from pypokerengine.engine.poker_constants import PokerConstants as Const
 from pypokerengine.engine.table import Table
@@ -7,17 +6,21 @@ from pypokerengine.engine.player import Player
 from pypokerengine.engine.round_manager import RoundManager
 from pypokerengine.engine.message_builder import MessageBuilder
 
+UUID_SIZE = 22
+# maps each random byte to a lowercase letter ('a' - 'z')
+UUID_CHAR_TABLE = bytes(bytearray(97 + code % 26 for code in range(256)))
+
 class Dealer:
 
-  def __init__(self, small_blind_amount=None, initial_stack=None, ante=None):
+  def __init__(self, small_blind_amount=None, initial_stack=None, ante=None, use_numba=False):
     self.small_blind_amount = small_blind_amount
     self.ante = ante if ante else 0
     self.initial_stack = initial_stack
-    self.uuid_list = self.__generate_uuid_list()
     self.message_handler = MessageHandler()
     self.message_summarizer = MessageSummarizer(verbose=0)
     self.table = Table()
     self.blind_structure = {}
+    if use_numba: self.__enable_numba_evaluator()
 
   def register_player(self, player_name, algorithm):
     self.__config_check()
@@ -30,25 +33,30 @@ class Dealer:
 
   def start_game(self, max_round):
     table = self.table
-    self.__notify_game_start(max_round)
+    config = self.__gen_config(max_round)
+    self.__notify_game_start(config)
     ante, sb_amount = self.ante, self.small_blind_amount
+    blind_structure = self.blind_structure
     for round_count in range(1, max_round+1):
-      ante, sb_amount = self.__update_forced_bet_amount(ante, sb_amount, round_count, self.blind_structure)
+      ante, sb_amount = self.__update_forced_bet_amount(ante, sb_amount, round_count, blind_structure)
       table = self.__exclude_short_of_money_players(table, ante, sb_amount)
       if self.__is_game_finished(table): break
       table = self.play_round(round_count, sb_amount, ante, table)
       table.shift_dealer_btn()
-    return self.__generate_game_result(max_round, table.seats)
+    self.table = table
+    return self.__generate_game_result(config, table.seats)
 
   def play_round(self, round_count, blind_amount, ante, table):
     state, msgs = RoundManager.start_new_round(round_count, blind_amount, ante, table)
     while True:
-      self.__message_check(msgs, state["street"])
-      if state["street"] != Const.Street.FINISHED:  # continue the round
-        action, bet_amount = self.__publish_messages(msgs)
+      street = state["street"]
+      last_address, last_msg = msgs[-1]
+      self.__message_check(last_msg["type"], last_msg, street)
+      if street != Const.Street.FINISHED:  # continue the round
+        action, bet_amount = self.__publish_messages(msgs, last_address, last_msg)
         state, msgs = RoundManager.apply_action(state, action, bet_amount)
       else:  # finish the round after publish round result
-        self.__publish_messages(msgs)
+        self.__publish_messages(msgs, last_address, last_msg)
         break
     return state["table"]
 
@@ -80,55 +88,78 @@ class Dealer:
     self.table.seats.sitdown(player)
     return uuid
 
-  def __notify_game_start(self, max_round):
-    config = self.__gen_config(max_round)
+  def __notify_game_start(self, config):
     start_msg = MessageBuilder.build_game_start_message(config, self.table.seats)
     self.message_handler.process_message(-1, start_msg)
     self.message_summarizer.summarize(start_msg)
 
   def __is_game_finished(self, table):
-    return len([player for player in  table.seats.players if player.is_active()]) == 1
-
-  def __message_check(self, msgs, street):
-    address, msg = msgs[-1]
-    invalid = msg["type"] != 'ask'
-    invalid &= street != Const.Street.FINISHED or msg["message"]["message_type"] == 'round_result'
-    if invalid:
-      raise Exception("Last message is not ask type. : %s" % msgs)
-
-  def __publish_messages(self, msgs):
-    for address, msg in msgs[:-1]:
-      self.message_handler.process_message(address, msg)
+    active_count = 0
+    for player in table.seats.players:
+      if player.is_active():
+        active_count += 1
+        if active_count > 1: return False
+    return active_count == 1
+
+  def __message_check(self, msg_type, msg, street):
+    if msg_type != 'ask' and \
+        (street != Const.Street.FINISHED or msg["message"]["message_type"] == 'round_result'):
+      raise Exception("Last message is not ask type. : %s" % msg)
+
+  def __publish_messages(self, msgs, last_address, last_msg):
+    self.__publish_notifications(msgs[:-1])
     self.message_summarizer.summarize_messages(msgs)
-    return self.message_handler.process_message(*msgs[-1])
+    return self.message_handler.process_message(last_address, last_msg)
+
+  # consecutive broadcasts (or unicasts) are sent in one batch so that
+  # each algorithm still receives its notifications in original order
+  def __publish_notifications(self, msgs):
+    broadcasts, unicasts = [], []
+    for address, msg in msgs:
+      if address == -1:
+        if unicasts:
+          self.message_handler.unicast_notifications(unicasts)
+          unicasts = []
+        broadcasts.append(msg["message"])
+      else:
+        if broadcasts:
+          self.message_handler.broadcast_notifications(broadcasts)
+          broadcasts = []
+        unicasts.append((address, msg["message"]))
+    if broadcasts: self.message_handler.broadcast_notifications(broadcasts)
+    if unicasts: self.message_handler.unicast_notifications(unicasts)
 
   def __exclude_short_of_money_players(self, table, ante, sb_amount):
     sb_pos, bb_pos = self.__steal_money_from_poor_player(table, ante, sb_amount)
-    self.__disable_no_money_player(table.seats.players)
     table.set_blind_pos(sb_pos, bb_pos)
     if table.seats.players[table.dealer_btn].stack == 0: table.shift_dealer_btn()
     return table
 
   def __steal_money_from_poor_player(self, table, ante, sb_amount):
     players = table.seats.players
-    # exclude player who cannot pay ante
-    for player in [p for p in players if p.stack < ante]: player.stack = 0
+    sb_need_amount = sb_amount + ante
+    bb_need_amount = sb_need_amount + sb_amount
+    # exclude player who cannot pay ante (and who already has no money)
+    for player in players:
+      if player.stack < ante: player.stack = 0
+      if player.stack == 0: player.pay_info.update_to_fold()
     if players[table.dealer_btn].stack == 0: table.shift_dealer_btn()
 
     search_targets = players + players + players
     search_targets = search_targets[table.dealer_btn+1:table.dealer_btn+1+len(players)]
     # exclude player who cannot pay small blind
-    sb_player = self.__find_first_elligible_player(search_targets, sb_amount + ante)
+    sb_player = self.__find_first_elligible_player(search_targets, sb_need_amount)
     sb_relative_pos = search_targets.index(sb_player)
-    for player in search_targets[:sb_relative_pos]: player.stack = 0
+    for player in search_targets[:sb_relative_pos]: self.__disable_player(player)
     # exclude player who cannot pay big blind
     search_targets = search_targets[sb_relative_pos+1:sb_relative_pos+len(players)]
-    bb_player = self.__find_first_elligible_player(search_targets, sb_amount*2 + ante, sb_player)
+    bb_player = self.__find_first_elligible_player(search_targets, bb_need_amount, sb_player)
     if sb_player == bb_player:  # no one can pay big blind. So steal money from all players except small blind
-        for player in [p for p in players if p!=bb_player]: player.stack = 0
+        for player in players:
+          if player != bb_player: self.__disable_player(player)
     else:
       bb_relative_pos = search_targets.index(bb_player)
-      for player in search_targets[:bb_relative_pos]: player.stack = 0
+      for player in search_targets[:bb_relative_pos]: self.__disable_player(player)
     return players.index(sb_player), players.index(bb_player)
 
 
@@ -136,13 +167,11 @@ class Dealer:
     if default: return next((player for player in players if player.stack >= need_amount), default)
     return next((player for player in players if player.stack >= need_amount))
 
-  def __disable_no_money_player(self, players):
-    no_money_players = [player for player in players if player.stack == 0]
-    for player in no_money_players:
-      player.pay_info.update_to_fold()
+  def __disable_player(self, player):
+    player.stack = 0
+    player.pay_info.update_to_fold()
 
-  def __generate_game_result(self, max_round, seats):
-    config = self.__gen_config(max_round)
+  def __generate_game_result(self, config, seats):
     result_message = MessageBuilder.build_game_result_message(config, seats)
     self.message_summarizer.summarize(result_message)
     return result_message
@@ -157,6 +186,12 @@ class Dealer:
     }
 
 
+  # numba is optional dependency. So import it only when fast path is requested.
+  # Note that hand evaluator is shared by whole process once it is enabled.
+  def __enable_numba_evaluator(self):
+    from pypokerengine.engine import hand_evaluator_numba
+    hand_evaluator_numba.enable()
+
   def __config_check(self):
     if self.small_blind_amount is None:
       raise Exception("small_blind_amount is not set!!\
@@ -166,47 +201,70 @@ class Dealer:
           You need to call 'dealer.set_initial_stack' before.")
 
   def __fetch_uuid(self):
-    return self.uuid_list.pop()
-
-  def __generate_uuid_list(self):
-    return [self.__generate_uuid() for _ in range(100)]
+    return self.__generate_uuid()
 
   def __generate_uuid(self):
-    uuid_size = 22
-    chars = [chr(code) for code in range(97,123)]
-    return "".join([random.choice(chars) for _ in range(uuid_size)])
+    return os.urandom(UUID_SIZE).translate(UUID_CHAR_TABLE).decode("ascii")
 
 class MessageHandler:
 
   def __init__(self):
     self.algo_owner_map = {}
+    self.algo_list = []  # same algorithms as algo_owner_map for fast broadcast
 
   def register_algorithm(self, uuid, algorithm):
+    if uuid in self.algo_owner_map:
+      self.algo_list.remove(self.algo_owner_map[uuid])
     self.algo_owner_map[uuid] = algorithm
+    self.algo_list.append(algorithm)
 
   def process_message(self, address, msg):
-    receivers = self.__fetch_receivers(address)
-    for receiver in receivers:
-      if msg["type"] == 'ask':
-        return receiver.respond_to_ask(msg["message"])
-      elif msg["type"] == 'notification':
-        receiver.receive_notification(msg["message"])
-      else:
-        raise ValueError("Received unexpected message which type is [%s]" % msg["type"])
-
-
-  def __fetch_receivers(self, address):
+    msg_type, content = msg["type"], msg["message"]
     if address == -1:
-      return self.algo_owner_map.values()
+      if msg_type == 'ask':
+        for receiver in self.algo_list:
+          return receiver.respond_to_ask(content)
+        return
+      elif msg_type == 'notification':
+        for receiver in self.algo_list:
+          receiver.receive_notification(content)
+        return
     else:
-      if address not in self.algo_owner_map:
+      receiver = self.algo_owner_map.get(address)
+      if receiver is None:
+        raise ValueError("Received message its address [%s] is unknown" % address)
+      if msg_type == 'ask':
+        return receiver.respond_to_ask(content)
+      elif msg_type == 'notification':
+        receiver.receive_notification(content)
+        return
+    raise ValueError("Received unexpected message which type is [%s]" % msg_type)
+
+  def broadcast_notifications(self, contents):
+    for receiver in self.algo_list:
+      for content in contents:
+        receiver.receive_notification(content)
+
+  def unicast_notifications(self, address_content_pairs):
+    for address, content in address_content_pairs:
+      receiver = self.algo_owner_map.get(address)
+      if receiver is None:
         raise ValueError("Received message its address [%s] is unknown" % address)
-      return [self.algo_owner_map[address]]
+      receiver.receive_notification(content)
 
 class MessageSummarizer(object):
 
     def __init__(self, verbose):
         self.verbose = verbose
+        self.uuid2name = {}
+        self.summarizers = {
+            MessageBuilder.GAME_START_MESSAGE: self.summarize_game_start,
+            MessageBuilder.ROUND_START_MESSAGE: self.summarize_round_start,
+            MessageBuilder.STREET_START_MESSAGE: self.summarize_street_start,
+            MessageBuilder.GAME_UPDATE_MESSAGE: self.summarize_player_action,
+            MessageBuilder.ROUND_RESULT_MESSAGE: self.summarize_round_result,
+            MessageBuilder.GAME_RESULT_MESSAGE: self.summarize_game_result
+        }
 
     def print_message(self, message):
         print(message)
@@ -214,28 +272,19 @@ class MessageSummarizer(object):
     def summarize_messages(self, raw_messages):
         if self.verbose == 0: return
 
-        summaries = [self.summarize(raw_message[1]) for raw_message in raw_messages]
-        summaries = [summary for summary in summaries if summary is not None]
-        summaries = list(OrderedDict.fromkeys(summaries))
-        for summary in summaries: self.print_message(summary)
+        printed = set()
+        for _, raw_message in raw_messages:
+            summary = self.summarize(raw_message)
+            if summary is not None and summary not in printed:
+                printed.add(summary)
+                self.print_message(summary)
 
     def summarize(self, message):
         if self.verbose == 0: return None
 
         content = message["message"]
-        message_type = content["message_type"]
-        if MessageBuilder.GAME_START_MESSAGE == message_type:
-            return self.summarize_game_start(content)
-        if MessageBuilder.ROUND_START_MESSAGE == message_type:
-            return self.summarize_round_start(content)
-        if MessageBuilder.STREET_START_MESSAGE == message_type:
-            return self.summarize_street_start(content)
-        if MessageBuilder.GAME_UPDATE_MESSAGE == message_type:
-            return self.summarize_player_action(content)
-        if MessageBuilder.ROUND_RESULT_MESSAGE == message_type:
-            return self.summarize_round_result(content)
-        if MessageBuilder.GAME_RESULT_MESSAGE == message_type:
-            return self.summarize_game_result(content)
+        summarizer = self.summarizers.get(content["message_type"])
+        if summarizer: return summarizer(content)
 
     def summarize_game_start(self, message):
         base = "Started the game with player %s for %d round. (start stack=%s, small blind=%s)"
@@ -255,21 +304,27 @@ class MessageSummarizer(object):
         base = '"%s" declared "%s:%s"'
         players = message["round_state"]["seats"]
         action = message["action"]
-        player_name = [player["name"] for player in players if player["uuid"] == action["player_uuid"]][0]
+        player_name = self.uuid2name.get(action["player_uuid"])
+        if player_name is None:  # first action of unseen player, so rebuild the mapping
+            self.uuid2name = { player["uuid"]:player["name"] for player in players }
+            player_name = self.uuid2name[action["player_uuid"]]
         return base % (player_name, action["action"], action["amount"])
 
     def summarize_round_result(self, message):
         base = '"%s" won the round %d (stack = %s)'
         winners = [player["name"] for player in message["winners"]]
-        stack = { player["name"]:player["stack"] for player in message["round_state"]["seats"] }
+        stack = self.__gen_stack_map(message["round_state"]["seats"])
         return base % (winners, message["round_count"], stack)
 
     def summarize_game_result(self, message):
         base = 'Game finished. (stack = %s)'
-        stack = { player["name"]:player["stack"] for player in message["game_information"]["seats"] }
+        stack = self.__gen_stack_map(message["game_information"]["seats"])
         return base % stack
 
     def summairze_blind_level_update(self, round_count, old_ante, new_ante, old_sb_amount, new_sb_amount):
         base = 'Blind level update at round-%d : Ante %s -> %s, SmallBlind %s -> %s'
         return base % (round_count, old_ante, new_ante, old_sb_amount, new_sb_amount)
 
+    # seats are rebuilt for every message, so the map is not cached across calls
+    def __gen_stack_map(self, seats):
+        return { player["name"]:player["stack"] for player in seats }
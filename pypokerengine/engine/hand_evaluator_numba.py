@@ -0,0 +1,120 @@
+import numpy as np
+from numba import njit
+
+from pypokerengine.engine.hand_evaluator import HandEvaluator
+
+# Numba compiled version of HandEvaluator.eval_hand.
+# numba is an optional dependency, so this module is imported only when
+# the fast path is requested (ex. Dealer(use_numba=True)).
+
+# numba cannot read class attributes, so hand flags are copied to globals
+ONEPAIR       = HandEvaluator.ONEPAIR
+TWOPAIR       = HandEvaluator.TWOPAIR
+THREECARD     = HandEvaluator.THREECARD
+STRAIGHT      = HandEvaluator.STRAIGHT
+FLASH         = HandEvaluator.FLASH
+FULLHOUSE     = HandEvaluator.FULLHOUSE
+FOURCARD      = HandEvaluator.FOURCARD
+STRAIGHTFLASH = HandEvaluator.STRAIGHTFLASH
+
+def eval_hand(hole, community):
+  cards = hole + community
+  ranks = np.array([card.rank for card in cards], dtype=np.int64)
+  suits = np.array([card.suit for card in cards], dtype=np.int64)
+  return _eval_hand(ranks, suits)
+
+def enable():
+  HandEvaluator.eval_hand = classmethod(lambda cls, hole, community: eval_hand(hole, community))
+
+def disable():
+  HandEvaluator.eval_hand = _original_eval_hand
+
+_original_eval_hand = HandEvaluator.__dict__["eval_hand"]
+
+# ranks and suits hold hole cards at index 0, 1 followed by community cards.
+# Return value has same format as HandEvaluator.eval_hand.
+@njit(cache=True)
+def _eval_hand(ranks, suits):
+  hole_flg = _eval_holecard(ranks)
+  return _calc_hand_info_flg(ranks, suits, hole_flg) << 8 | hole_flg
+
+@njit(cache=True)
+def _calc_hand_info_flg(ranks, suits, hole_flg):
+  counts = np.zeros(15, dtype=np.int64)
+  for rank in ranks: counts[rank] += 1
+
+  rank = _search_straightflash(ranks, suits)
+  if rank != -1: return STRAIGHTFLASH | rank << 4
+  rank = _search_count(counts, 4)
+  if rank != -1: return FOURCARD | rank << 4
+  r1, r2 = _search_fullhouse(counts)
+  if r1 != -1 and r2 != -1: return FULLHOUSE | r1 << 4 | r2
+  rank = _search_flash(ranks, suits)
+  if rank != -1: return FLASH | rank << 4
+  rank = _search_straight(ranks)
+  if rank != -1: return STRAIGHT | rank << 4
+  rank = _search_count(counts, 3)
+  if rank != -1: return THREECARD | rank << 4
+  r1, r2 = _search_twopair(ranks)
+  if r2 != -1: return TWOPAIR | r1 << 4 | r2
+  if r1 != -1: return ONEPAIR | r1 << 4
+  return hole_flg
+
+@njit(cache=True)
+def _eval_holecard(ranks):
+  return max(ranks[0], ranks[1]) << 4 | min(ranks[0], ranks[1])
+
+# HandEvaluator counts a rank once more each time its card repeats.
+# So three card of rank 9 is regarded as two pair of (9, 9) here.
+@njit(cache=True)
+def _search_twopair(ranks):
+  r1, r2 = -1, -1
+  memo = 0
+  for rank in ranks:
+    mask = 1 << rank
+    if memo & mask != 0:
+      if rank >= r1: r1, r2 = rank, r1
+      elif rank > r2: r2 = rank
+    memo |= mask
+  return r1, r2
+
+# return highest rank which appears at least "count" times
+@njit(cache=True)
+def _search_count(counts, count):
+  for rank in range(14, 1, -1):
+    if counts[rank] >= count: return rank
+  return -1
+
+@njit(cache=True)
+def _search_straight(ranks):
+  bit_memo = 0
+  for rank in ranks: bit_memo |= 1 << rank
+  for rank in range(14, 1, -1):
+    if bit_memo >> rank & 31 == 31: return rank
+  return -1
+
+@njit(cache=True)
+def _search_flash(ranks, suits):
+  best_suit_rank = -1
+  for suit in (2, 4, 8, 16):
+    if np.sum(suits == suit) >= 5:
+      best_suit_rank = max(best_suit_rank, np.max(ranks[suits == suit]))
+  return best_suit_rank
+
+@njit(cache=True)
+def _search_fullhouse(counts):
+  three_card_rank, two_pair_rank = -1, -1
+  for rank in range(14, 1, -1):
+    if counts[rank] >= 3 and three_card_rank == -1:
+      three_card_rank = rank
+    elif counts[rank] >= 2 and two_pair_rank == -1:
+      two_pair_rank = rank
+  return three_card_rank, two_pair_rank
+
+@njit(cache=True)
+def _search_straightflash(ranks, suits):
+  for suit in (16, 8, 4, 2):
+    if np.sum(suits == suit) >= 5:
+      return _search_straight(ranks[suits == suit])
+  return -1
+
@@ -0,0 +1,17 @@
+from multiprocessing import Pool
+
+# Games played by different dealers share no state, so they can run on separate processes.
+# "factory" must be picklable (ex. module level function) and return a new Dealer
+# whose players are already registered.
+def simulate_many(factory, n_games, max_round, n_workers=None):
+  pool = Pool(processes=n_workers)
+  try:
+    return pool.map(_play_game, [(factory, max_round)] * n_games)
+  finally:
+    pool.close()
+    pool.join()
+
+def _play_game(args):
+  factory, max_round = args
+  return factory().start_game(max_round)
+
@@ -10,6 +10,9 @@ setup(
     keywords = 'python poker emgine ai',
     url = 'https://github.com/ishikota/PyPokerEngine',
     packages = [pkg for pkg in find_packages() if pkg != "tests"],
+    extras_require = {
+        "numba": ["numba"],
+    },
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "License :: OSI Approved :: MIT License",
@@ -36,3 +36,28 @@ class MessageHandlerTest(BaseUnitTest):
     p2_algo_args = self.p2_algo.receive_notification.call_args_list[0][0][0]
     self.eq("hoge", p2_algo_args)
 
+
+  def test_register_algorithm_twice(self):
+    new_algo = Mock()
+    self.mh.register_algorithm(self.p1.uuid, new_algo)
+    self.mh.process_message(-1, { "type":"notification", "message":"hoge" })
+    self.eq(0, self.p1_algo.receive_notification.call_count)
+    self.eq(1, new_algo.receive_notification.call_count)
+    self.eq(1, self.p2_algo.receive_notification.call_count)
+
+  def test_broadcast_notifications(self):
+    self.mh.broadcast_notifications(["hoge", "fuga"])
+    for algo in [self.p1_algo, self.p2_algo]:
+      algo_args = [args[0][0] for args in algo.receive_notification.call_args_list]
+      self.eq(["hoge", "fuga"], algo_args)
+
+  def test_unicast_notifications(self):
+    self.mh.unicast_notifications([("uuid2", "hoge"), ("uuid1", "fuga"), ("uuid2", "piyo")])
+    p1_algo_args = [args[0][0] for args in self.p1_algo.receive_notification.call_args_list]
+    self.eq(["fuga"], p1_algo_args)
+    p2_algo_args = [args[0][0] for args in self.p2_algo.receive_notification.call_args_list]
+    self.eq(["hoge", "piyo"], p2_algo_args)
+
+  def test_unicast_notifications_to_unknown_address(self):
+    with self.assertRaises(ValueError):
+      self.mh.unicast_notifications([("uuid3", "hoge")])
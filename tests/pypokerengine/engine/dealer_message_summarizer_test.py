@@ -47,11 +47,27 @@ class MessageSummarizerTest(BaseUnitTest):
         #expected = '"p1" declared "fold:0"'
         self._check_words(["p1", "fold"], summary)
 
+    def test_summarize_player_action_of_other_player(self):
+        self.summarizer.summarize(game_update_message)
+        action = {'player_uuid': 'wbjujtrhizogjrliknebeg', 'action': 'call', 'amount': 10}
+        content = dict(game_update_message["message"], action=action)
+        summary = self.summarizer.summarize(dict(game_update_message, message=content))
+        #expected = '"p2" declared "call:10"'
+        self._check_words(["p2", "call", "10"], summary)
+
     def test_summarize_round_result(self):
         summary = self.summarizer.summarize(round_result_message)
         #expected = '"p2" won the round 1 (stack = { p1 : 95, p2 : 105 })'
         self._check_words(["p2", "round 1", "95", "105"], summary)
 
+    def test_summarize_round_result_after_stack_changed(self):
+        self.summarizer.summarize(round_result_message)
+        seats = [dict(seat, stack=seat["stack"]+3) for seat in round_result_message["message"]["round_state"]["seats"]]
+        round_state = dict(round_result_message["message"]["round_state"], seats=seats)
+        content = dict(round_result_message["message"], round_state=round_state)
+        summary = self.summarizer.summarize(dict(round_result_message, message=content))
+        self._check_words(["98", "108"], summary)
+
     def test_summarize_game_result(self):
         summary = self.summarizer.summarize(game_result_message)
         #expected = 'Game finished. (stack = { p1 : 100, p2 : 100 })'
@@ -70,51 +70,43 @@ class DealerTest(BaseUnitTest):
     self.eq(100, player_state[1]["stack"])
 
   def test_exclude_short_of_money_player(self):
-    algos = [FoldMan() for _ in range(7)]
-    [self.dealer.register_player("algo-%d" % idx, algo) for idx, algo in enumerate(algos)]
-    self.dealer.table.dealer_btn = 5
-    # initialize stack
-    for idx, stack in enumerate([11, 7, 9, 11, 9, 7, 100]):
-      self.dealer.table.seats.players[idx].stack = stack
-    fetch_stacks = lambda res: [p["stack"] for p in res["message"]["game_information"]["seats"]]
+    def play(max_round):
+      dealer = Dealer(5, 100)
+      algos = [FoldMan() for _ in range(7)]
+      [dealer.register_player("algo-%d" % idx, algo) for idx, algo in enumerate(algos)]
+      dealer.table.dealer_btn = 5
+      # initialize stack
+      for idx, stack in enumerate([11, 7, 9, 11, 9, 7, 100]):
+        dealer.table.seats.players[idx].stack = stack
+      return fetch_stacks(dealer.start_game(max_round))
 
-    # -- NOTICE --
-    # dealer.start_game does not change the internal table.
-    # So running dealer.start_game twice returns same result
     # dealer_btn progress
     # round-1 => sb:player6, bb:player0
     # round-2 => sb:player0, bb:player3
     # round-3 => sb:player3, bb:player6
     # round-3 => sb:player6, bb:player0
-    result = self.dealer.start_game(1)
-    self.eq(fetch_stacks(result), [16, 7, 9, 11, 9, 7, 95])
-    result = self.dealer.start_game(2)
-    self.eq(fetch_stacks(result), [11, 0, 0, 16, 9, 7, 95])
-    result = self.dealer.start_game(3)
-    self.eq(fetch_stacks(result), [11, 0, 0, 11, 0, 0, 100])
-    result = self.dealer.start_game(4)
-    self.eq(fetch_stacks(result), [16, 0, 0, 11, 0, 0, 95])
+    self.eq(play(1), [16, 7, 9, 11, 9, 7, 95])
+    self.eq(play(2), [11, 0, 0, 16, 9, 7, 95])
+    self.eq(play(3), [11, 0, 0, 11, 0, 0, 100])
+    self.eq(play(4), [16, 0, 0, 11, 0, 0, 95])
 
   def test_exclude_short_of_money_player_when_ante_on(self):
-    dealer = Dealer(5, 100, 20)
-    blind_structure = { 3:{"ante":30, "small_blind": 10}}
-    dealer.set_blind_structure(blind_structure)
-    algos = [FoldMan() for _ in range(5)]
-    [dealer.register_player("algo-%d" % idx, algo) for idx, algo in enumerate(algos)]
-    dealer.table.dealer_btn = 3
-    # initialize stack
-    for idx, stack in enumerate([1000, 30, 46, 1000, 85]):
-      dealer.table.seats.players[idx].stack = stack
-    fetch_stacks = lambda res: [p["stack"] for p in res["message"]["game_information"]["seats"]]
-
-    result = dealer.start_game(1)
-    self.eq(fetch_stacks(result), [1085, 10, 26, 980, 60])
-    result = dealer.start_game(2)
-    self.eq(fetch_stacks(result), [1060, 0, 0, 1025, 40])
-    result = dealer.start_game(3)
-    self.eq(fetch_stacks(result), [1100, 0, 0, 985, 0])
-    result = dealer.start_game(4)
-    self.eq(fetch_stacks(result), [1060, 0, 0, 1025, 0])
+    def play(max_round):
+      dealer = Dealer(5, 100, 20)
+      blind_structure = { 3:{"ante":30, "small_blind": 10}}
+      dealer.set_blind_structure(blind_structure)
+      algos = [FoldMan() for _ in range(5)]
+      [dealer.register_player("algo-%d" % idx, algo) for idx, algo in enumerate(algos)]
+      dealer.table.dealer_btn = 3
+      # initialize stack
+      for idx, stack in enumerate([1000, 30, 46, 1000, 85]):
+        dealer.table.seats.players[idx].stack = stack
+      return fetch_stacks(dealer.start_game(max_round))
+
+    self.eq(play(1), [1085, 10, 26, 980, 60])
+    self.eq(play(2), [1060, 0, 0, 1025, 40])
+    self.eq(play(3), [1100, 0, 0, 985, 0])
+    self.eq(play(4), [1060, 0, 0, 1025, 0])
 
   def test_exclude_short_of_money_player_when_ante_on2(self):
     dealer = Dealer(5, 100, 20)
@@ -138,23 +130,33 @@ class DealerTest(BaseUnitTest):
     summary = self.dealer.start_game(2)
 
   def test_set_blind_structure(self):
-    dealer = Dealer(5, 100, 3)
-    dealer.table.dealer_btn = 2
-    blind_structure = { 3:{"ante":7, "small_blind": 11}, 4:{"ante":13, "small_blind":30} }
-    dealer.set_blind_structure(blind_structure)
-    algos = [FoldMan() for _ in range(3)]
-    [dealer.register_player("algo-%d" % idx, algo) for idx, algo in enumerate(algos)]
-    fetch_stacks = lambda res: [p["stack"] for p in res["message"]["game_information"]["seats"]]
-    result = dealer.start_game(1)
-    self.eq(fetch_stacks(result), [92, 111, 97])
-    result = dealer.start_game(2)
-    self.eq(fetch_stacks(result), [89, 103, 108])
-    result = dealer.start_game(3)
-    self.eq(fetch_stacks(result), [114, 96, 90])
-    result = dealer.start_game(4)
-    self.eq(fetch_stacks(result), [71, 152, 77])
-    result = dealer.start_game(5)
-    self.eq(fetch_stacks(result), [58, 109, 133])
+    def play(max_round):
+      dealer = Dealer(5, 100, 3)
+      dealer.table.dealer_btn = 2
+      blind_structure = { 3:{"ante":7, "small_blind": 11}, 4:{"ante":13, "small_blind":30} }
+      dealer.set_blind_structure(blind_structure)
+      algos = [FoldMan() for _ in range(3)]
+      [dealer.register_player("algo-%d" % idx, algo) for idx, algo in enumerate(algos)]
+      return fetch_stacks(dealer.start_game(max_round))
+
+    self.eq(play(1), [92, 111, 97])
+    self.eq(play(2), [89, 103, 108])
+    self.eq(play(3), [114, 96, 90])
+    self.eq(play(4), [71, 152, 77])
+    self.eq(play(5), [58, 109, 133])
+
+  def test_table_is_updated_after_game(self):
+    algos = [FoldMan() for _ in range(2)]
+    [self.dealer.register_player(name, algo) for name, algo in zip(["hoge", "fuga"], algos)]
+    self.dealer.table.dealer_btn = 1
+    result = self.dealer.start_game(1)
+    self.eq(fetch_stacks(result), [p.stack for p in self.dealer.table.seats.players])
+    self.eq([95, 105], [p.stack for p in self.dealer.table.seats.players])
+    result = self.dealer.start_game(1)
+    self.eq([100, 100], fetch_stacks(result))
+
+def fetch_stacks(result):
+  return [p["stack"] for p in result["message"]["game_information"]["seats"]]
 
 class RecordMan(FoldMan):
 
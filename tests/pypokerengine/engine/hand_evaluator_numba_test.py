@@ -0,0 +1,51 @@
+import unittest
+
+from tests.base_unittest import BaseUnitTest
+from pypokerengine.engine.deck import Deck
+from pypokerengine.engine.hand_evaluator import HandEvaluator
+from pypokerengine.utils.card_utils import gen_cards
+
+try:
+  from pypokerengine.engine import hand_evaluator_numba
+except ImportError:
+  hand_evaluator_numba = None
+
+@unittest.skipIf(hand_evaluator_numba is None, "numba is not installed")
+class HandEvaluatorNumbaTest(BaseUnitTest):
+
+  def tearDown(self):
+    hand_evaluator_numba.disable()
+
+  def test_eval_hand(self):
+    hands = [
+        (["C9", "D2"], ["C3", "C7", "CT", "D5", "D6"]),  # high card
+        (["C3", "D2"], ["C3", "C7", "CT", "D5", "D6"]),  # one pair
+        (["C3", "D7"], ["H3", "C7", "CT", "D5", "D6"]),  # two pair
+        (["C3", "D3"], ["H3", "C7", "CT", "D5", "D6"]),  # three card
+        (["C3", "D4"], ["H5", "C6", "C7", "DK", "DQ"]),  # straight
+        (["C3", "C4"], ["C5", "C9", "CT", "DK", "DQ"]),  # flash
+        (["C3", "D3"], ["H3", "C4", "D4", "H4", "DQ"]),  # full house
+        (["C3", "D3"], ["H3", "S3", "D4", "H4", "DQ"]),  # four card
+        (["C3", "C4"], ["C5", "C6", "C7", "DK", "DQ"]),  # straight flash
+        (["CA", "D2"], ["C3", "H7", "CT"])
+        ]
+    for hole, community in hands:
+      hole, community = gen_cards(hole), gen_cards(community)
+      expected = HandEvaluator.eval_hand(hole, community)
+      self.eq(expected, hand_evaluator_numba.eval_hand(hole, community))
+
+  def test_eval_random_hand(self):
+    for _ in range(1000):
+      deck = Deck()
+      deck.shuffle()
+      hole, community = deck.draw_cards(2), deck.draw_cards(5)
+      expected = HandEvaluator.eval_hand(hole, community)
+      self.eq(expected, hand_evaluator_numba.eval_hand(hole, community))
+
+  def test_enable(self):
+    hole, community = gen_cards(["C3", "D3"]), gen_cards(["H3", "C4", "D4", "H4", "DQ"])
+    expected = HandEvaluator.gen_hand_rank_info(hole, community)
+    hand_evaluator_numba.enable()
+    self.eq(expected, HandEvaluator.gen_hand_rank_info(hole, community))
+    self.eq(hand_evaluator_numba.eval_hand(hole, community), HandEvaluator.eval_hand(hole, community))
+
@@ -0,0 +1,21 @@
+from tests.base_unittest import BaseUnitTest
+from pypokerengine.engine.dealer import Dealer
+from pypokerengine.engine.parallel import simulate_many
+from examples.players.fold_man import FoldMan
+
+class ParallelTest(BaseUnitTest):
+
+  def test_simulate_many(self):
+    results = simulate_many(create_dealer, 3, 2, n_workers=2)
+    self.eq(3, len(results))
+    for result in results:
+      self.eq("game_result_message", result["message"]["message_type"])
+      stacks = [p["stack"] for p in result["message"]["game_information"]["seats"]]
+      self.eq([100, 100], stacks)
+
+def create_dealer():
+  dealer = Dealer(5, 100)
+  for name in ["hoge", "fuga"]:
+    dealer.register_player(name, FoldMan())
+  return dealer
+